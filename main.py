@@ -426,17 +426,10 @@ class RC4Visualizer:
         # Pack the TabuAttackGUI directly (it's already a Frame)
         tabu_gui.pack(fill=tk.BOTH, expand=True)
 
-        # Manejar el cierre de la ventana para detener el hilo del ataque
-        def on_close():
-            # Stop the attack if it's running
-            if hasattr(tabu_gui, "_stop_attack"):
-                tabu_gui._stop_attack()
-            elif hasattr(tabu_gui, "cracker") and tabu_gui.cracker:
-                tabu_gui.cracker.stop()
-
-            tabu_window.destroy()
-
-        tabu_window.protocol("WM_DELETE_WINDOW", on_close)
+        # Manejar el cierre de la ventana: _on_close apaga el executor del
+        # cracker (hilos no-daemon — con solo stop() el intérprete quedaría
+        # esperando al worker al salir) y destruye la ventana
+        tabu_window.protocol("WM_DELETE_WINDOW", tabu_gui._on_close)
 
 
 def main():
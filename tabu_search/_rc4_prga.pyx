@@ -0,0 +1,173 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython fallback for the RC4+ PRGA kernels in tabu_logic.py.
+
+Used automatically when numba is not installed but this extension has been
+compiled. Build in place with:
+
+    pip install cython
+    cythonize -i tabu_search/_rc4_prga.pyx
+
+The functions mirror _rc4_plus_prga_kernel / _rc4_plus_fitness_kernel /
+_evaluate_neighborhood_kernel: same arguments, same results. The batch
+neighborhood pass runs serially (no prange here) but each lane is native
+code, which is what matters on the no-numba path.
+
+Read-only inputs are declared `const`: tabu_logic marks the target
+arrays read-only with setflags(write=False), and a writable memoryview
+would reject them with "buffer source array is read-only".
+"""
+
+import numpy as np
+
+
+def rc4_plus_prga_c(unsigned char[::1] S_work, unsigned char[::1] keystream,
+                    int length, int N, int mask, int shift_right,
+                    int shift_left, int shift_up, int xor_constant):
+    """Fill keystream from S_work (mutated in place). See _rc4_plus_prga_kernel."""
+    cdef unsigned int i = 0, j = 0
+    cdef unsigned int t, t_prime, t_double, idx1, idx2, val1, output, tmp
+    cdef int step
+
+    for step in range(length):
+        i = (i + 1) & mask
+        j = (j + S_work[i]) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (S_work[i] + S_work[j]) & mask
+        idx1 = ((i >> shift_right) ^ (j << shift_left)) & mask
+        idx2 = ((i << shift_left) ^ (j >> shift_right)) & mask
+
+        t_prime = (((S_work[idx1] + S_work[idx2]) & mask) ^ xor_constant) & mask
+        t_double = (j + S_work[j]) & mask
+
+        val1 = ((S_work[t] + S_work[t_prime]) << shift_up) & 0xFF
+        output = (val1 ^ ((S_work[t_double] << shift_up) & 0xFF)) & 0xFF
+
+        keystream[step] = <unsigned char> output
+
+
+def rc4_plus_fitness_c(unsigned char[::1] S_work,
+                       const unsigned char[::1] target,
+                       int length, int N, int mask, int shift_right,
+                       int shift_left, int shift_up, int xor_constant):
+    """Fused PRGA + match count. See _rc4_plus_fitness_kernel."""
+    cdef unsigned int i = 0, j = 0
+    cdef unsigned int t, t_prime, t_double, idx1, idx2, val1, output, tmp
+    cdef int step, matches = 0
+
+    for step in range(length):
+        i = (i + 1) & mask
+        j = (j + S_work[i]) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (S_work[i] + S_work[j]) & mask
+        idx1 = ((i >> shift_right) ^ (j << shift_left)) & mask
+        idx2 = ((i << shift_left) ^ (j >> shift_right)) & mask
+
+        t_prime = (((S_work[idx1] + S_work[idx2]) & mask) ^ xor_constant) & mask
+        t_double = (j + S_work[j]) & mask
+
+        val1 = ((S_work[t] + S_work[t_prime]) << shift_up) & 0xFF
+        output = (val1 ^ ((S_work[t_double] << shift_up) & 0xFF)) & 0xFF
+
+        if output == target[step]:
+            matches += 1
+
+    return matches
+
+
+cdef long long _fitness_resume(unsigned char[::1] S_work,
+                               const unsigned char[::1] target, int start_step,
+                               int j0, int matches0, int length, int mask,
+                               int shift_right, int shift_left, int shift_up,
+                               int xor_constant, long long limit,
+                               bint bounded) noexcept:
+    """Resume the fused PRGA+fitness at start_step; with `bounded` set,
+    bail out once the count can no longer exceed `limit` (tabu lanes)."""
+    cdef unsigned int i = start_step & mask
+    cdef unsigned int j = j0
+    cdef unsigned int t, t_prime, t_double, idx1, idx2, val1, output, tmp
+    cdef int step
+    cdef long long matches = matches0
+
+    for step in range(start_step, length):
+        i = (i + 1) & mask
+        j = (j + S_work[i]) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (S_work[i] + S_work[j]) & mask
+        idx1 = ((i >> shift_right) ^ (j << shift_left)) & mask
+        idx2 = ((i << shift_left) ^ (j >> shift_right)) & mask
+
+        t_prime = (((S_work[idx1] + S_work[idx2]) & mask) ^ xor_constant) & mask
+        t_double = (j + S_work[j]) & mask
+
+        val1 = ((S_work[t] + S_work[t_prime]) << shift_up) & 0xFF
+        output = (val1 ^ ((S_work[t_double] << shift_up) & 0xFF)) & 0xFF
+
+        if output == target[step]:
+            matches += 1
+        elif bounded and matches + (length - step - 1) <= limit:
+            return matches
+
+    return matches
+
+
+def evaluate_neighborhood_c(const unsigned char[::1] candidate,
+                            const short[::1] swaps_i,
+                            const short[::1] swaps_j,
+                            const int[::1] sel, tabu_flags,
+                            long long best_fitness,
+                            const int[::1] first_touch,
+                            const unsigned char[:, ::1] S_snap,
+                            const int[::1] j_snap,
+                            const int[::1] match_snap,
+                            long long base_fitness,
+                            const unsigned char[::1] target,
+                            unsigned char[:, ::1] scratch, int length, int N,
+                            int mask, int shift_right, int shift_left,
+                            int shift_up, int xor_constant,
+                            long long[::1] fitness_out):
+    """Serial batch mirror of _evaluate_neighborhood_kernel: per selected
+    swap, restore the trace snapshot at the first affected step, exchange
+    the pair and resume the fitness kernel (bounded for tabu lanes).
+    Serial, so only row 0 of the per-thread scratch is used."""
+    cdef unsigned char[::1] tabu = np.asarray(tabu_flags).view(np.uint8)
+    cdef unsigned char[::1] S_work = scratch[0]
+    cdef Py_ssize_t k, n = sel.shape[0]
+    cdef int a, b, f, f_b, sid
+    cdef unsigned char tmp
+    cdef long long fitness
+
+    for k in range(n):
+        sid = sel[k]
+        a = swaps_i[sid]
+        b = swaps_j[sid]
+
+        f = first_touch[a]
+        f_b = first_touch[b]
+        if f_b < f:
+            f = f_b
+
+        if f >= length:
+            fitness = base_fitness
+        else:
+            S_work[:] = S_snap[f]
+            tmp = S_work[a]
+            S_work[a] = S_work[b]
+            S_work[b] = tmp
+
+            fitness = _fitness_resume(
+                S_work, target, f, j_snap[f], match_snap[f], length, mask,
+                shift_right, shift_left, shift_up, xor_constant,
+                best_fitness, tabu[k] != 0
+            )
+
+        fitness_out[k] = fitness
@@ -3,6 +3,7 @@ from tkinter import ttk
 import queue
 import math
 import logging
+import numpy as np
 from tabu_search.tabu_logic import generate_rc4_plus_keystream, TabuCracker
 from utils.utils import show_algorithm_info_text, show_help_text
 
@@ -12,6 +13,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hoisted Tk constant so hot loops avoid the tkinter module attribute lookup
+_END = tk.END
+
+# Cell fill colors indexed by the vectorized color classification:
+# 0 = correct, 1 = was correct (memory), 2 = incorrect
+_CELL_COLORS = ("lightgreen", "orange", "lightcoral")
+
+# Hex labels for every byte value, so the draw loops index a tuple
+# instead of running the format-spec parser per cell
+_HEX = tuple(f"{i:02X}" for i in range(256))
+
+
+def _classify_help_lines(help_text):
+    """Pre-classify the static help text into (text, tags) insert segments.
+
+    The help content never changes, so the per-line parsing and icon/style
+    selection runs once at import instead of on every help-window open.
+    """
+    segments = []
+    for line in help_text.split("\n"):
+        if line.startswith("Ayuda:"):
+            segments.append((line + "\n\n", ("h1",)))
+        elif line and line[0].isdigit() and "." in line:
+            segments.append((line + "\n", ("h2",)))
+        elif line.strip().startswith("-"):
+            clean_line = line.strip()[1:].strip()
+            parts = clean_line.split(":", 1)
+
+            if len(parts) == 2:
+                segments.append(("• ", ("bullet",)))
+
+                # Lógica para elegir el icono y color según el texto
+                key_text = parts[0]
+                icon = ""
+                style = ("bullet", "bold")  # Estilo por defecto
+
+                if "Incorrecto" in key_text:
+                    icon = "✖ "
+                    style = ("bullet", "bold", "error")
+                elif "Fue Correcto" in key_text:
+                    icon = "⚠️ "
+                    style = ("bullet", "bold", "antes_success")
+                elif "Correcto" in key_text:
+                    icon = "✔ "
+                    style = ("bullet", "bold", "success")
+                elif "Intercambio" in key_text:
+                    icon = "⇄ "
+                    style = ("bullet", "bold", "info")
+
+                segments.append((f"{icon}{key_text}:", style))
+                segments.append((f"{parts[1]}\n", ("bullet",)))
+            else:
+                segments.append((f"• {clean_line}\n", ("bullet",)))
+        else:
+            segments.append((line + "\n", ()))
+    return segments
+
+
+_HELP_SEGMENTS = _classify_help_lines(show_help_text())
+
 
 class TabuAttackGUI(tk.Frame):
     """
@@ -29,19 +90,61 @@ class TabuAttackGUI(tk.Frame):
         self.cracker = None
         self.target_state = None
         self.target_keystream = None
-        self.update_queue = queue.Queue()
+        # Bounded: when the worker outruns the GUI, old stats are dropped
+        # instead of growing the queue without limit
+        self.update_queue = queue.Queue(maxsize=4)
         self.is_running = False
 
-        # Memory tracking for orange cells
-        self.memory_correct = set()  # Set of indices that were correct at some point
-        self.memory_correct_keystream = set()  #  Memory for keystream bytes
+        # Handle of the search worker thread (spawned by cracker.run); all
+        # widget writes stay on the Tk main thread via _update_ui/after()
+        self._worker = None
+
+        # Memory tracking for orange cells: boolean masks so the per-frame
+        # correct/was-correct classification is three numpy ops instead of
+        # N Python compares and set lookups (sized for the max N / length)
+        self.memory_correct_mask = np.zeros(256, dtype=bool)
+        self.memory_correct_keystream_mask = np.zeros(256, dtype=bool)
+
+        # Pooled canvas items for incremental redraw: the cell grids are
+        # created once per (canvas, N, size) and then only the cells whose
+        # color/text actually changed get an itemconfigure — a typical Tabu
+        # move changes 2 cells, not N
+        self._sbox_items = {}
+        self._ks_items = {}
+
+        # Canvas sizes cached from <Configure> events, so draw functions
+        # never force a synchronous geometry pass per frame
+        self._canvas_size = {}
+
+        # Last text shown per status label, so unchanged values skip the
+        # Tcl reconfiguration entirely
+        self._last_labels = {}
+
+        # Last drawn tabu moves, for suffix-only listbox updates
+        self._last_tabu = ()
+
+        # Help window built lazily on first open, then hidden/reshown
+        self._help_window = None
+
+        # Last drawn keystream frame per canvas: the target row never
+        # changes and the best row changes only on improvement, so most
+        # ticks skip those rows entirely
+        self._last_ks_frame = {}
 
         # UI update rate (ms) - will be set dynamically based on attack mode
         self.update_interval = 100
 
+        # Visibility flag kept current by <Map>/<Unmap>, so the update tick
+        # can skip canvas redraws without a Tcl query while the window is
+        # minimized or the tab is hidden
+        self._visible = True
+
         # Build the interface
         self._build_ui()
 
+        self.bind("<Map>", lambda e: setattr(self, "_visible", True))
+        self.bind("<Unmap>", lambda e: setattr(self, "_visible", False))
+
         # Start UI update loop
         self._schedule_ui_update()
 
@@ -172,6 +275,18 @@ class TabuAttackGUI(tk.Frame):
             font=("Arial", 9)
         ).pack(anchor="w")
 
+        # Cell value display: at N > 64 the labels are unreadable anyway and
+        # cost N text items per canvas, so they are off beyond that size
+        self.show_values_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            config_frame,
+            text="Mostrar valores (N ≤ 64)",
+            variable=self.show_values_var,
+            command=self._on_toggle_values,
+            bg=self.bg_color,
+            font=("Arial", 9),
+        ).pack(anchor="w", padx=5, pady=(0, 5))
+
         # Control buttons
         self.start_button = tk.Button(
             left_frame,
@@ -296,6 +411,7 @@ class TabuAttackGUI(tk.Frame):
             sbox_frame, bg="white", highlightthickness=1, highlightbackground="gray"
         )
         self.target_canvas.grid(row=1, column=0, sticky="nsew", padx=(0, 5))
+        self._track_canvas_size(self.target_canvas)
 
         # Candidate S-Box (Right)
         candidate_label = tk.Label(
@@ -310,6 +426,7 @@ class TabuAttackGUI(tk.Frame):
             sbox_frame, bg="white", highlightthickness=1, highlightbackground="gray"
         )
         self.candidate_canvas.grid(row=1, column=1, sticky="nsew", padx=(5, 0))
+        self._track_canvas_size(self.candidate_canvas)
 
         #Color Legend
         self._create_color_legend(sbox_frame)
@@ -421,6 +538,7 @@ class TabuAttackGUI(tk.Frame):
             highlightbackground="gray",
         )
         self.target_ks_canvas.pack(side="left", fill="x", expand=True)
+        self._track_canvas_size(self.target_ks_canvas)
 
         # Current keystream
         current_ks_frame = tk.Frame(keystream_frame, bg=self.bg_color)
@@ -443,6 +561,7 @@ class TabuAttackGUI(tk.Frame):
             highlightbackground="gray",
         )
         self.current_ks_canvas.pack(side="left", fill="x", expand=True)
+        self._track_canvas_size(self.current_ks_canvas)
 
         # Best keystream
         best_ks_frame = tk.Frame(keystream_frame, bg=self.bg_color)
@@ -465,63 +584,277 @@ class TabuAttackGUI(tk.Frame):
             highlightbackground="gray",
         )
         self.best_ks_canvas.pack(side="left", fill="x", expand=True)
+        self._track_canvas_size(self.best_ks_canvas)
+
+    def _blank_pools(self):
+        """Blank pooled canvas items instead of deleting them.
+
+        Rectangle/text pools are reset to the default look and reused by
+        the next attack, avoiding Tcl object churn on every run. Image-mode
+        pools are cheaper to rebuild than to repaint cell by cell, so those
+        canvases are cleared and their pools dropped.
+        """
+        for canvas in list(self._sbox_items):
+            pool = self._sbox_items[canvas]
+            if pool["mode"] == "image":
+                canvas.delete("all")
+                del self._sbox_items[canvas]
+                continue
+
+            _item = canvas.itemconfigure
+            for rid in pool["rect_ids"]:
+                _item(rid, fill="white", outline="gray", width=1)
+            for tid in pool["text_ids"]:
+                _item(tid, text="")
+            n = pool["n"]
+            pool["fills"] = ["white"] * n
+            pool["widths"] = [1] * n
+            pool["texts"] = [""] * n
+
+        for canvas, pool in self._ks_items.items():
+            _item = canvas.itemconfigure
+            for rid, tid in zip(pool["rect_ids"], pool["text_ids"]):
+                _item(rid, fill="white")
+                _item(tid, text="")
+            n = pool["n"]
+            pool["fills"] = ["white"] * n
+            pool["texts"] = [""] * n
+
+    def _on_toggle_values(self):
+        """Rebuild the S-Box grids on next draw with/without text items"""
+        for canvas in list(self._sbox_items):
+            canvas.delete("all")
+        self._sbox_items.clear()
+
+        # The candidate grids repaint on the next stats frame, but the
+        # target S-Box is only drawn at attack start — redraw it now or
+        # the toggle leaves that panel blank until the next run
+        if self.target_state is not None:
+            self._draw_sbox(self.target_canvas, self.target_state)
 
-    def _draw_sbox(self, canvas, sbox_array, target_sbox=None, current_swap=None):
-        """MODIFIED: Draw S-Box with colored borders for swap highlighting"""
-        canvas.delete("all")
+    def _track_canvas_size(self, canvas):
+        """Cache the canvas size on resize instead of querying it per frame"""
+        canvas.bind(
+            "<Configure>",
+            lambda e, c=canvas: self._canvas_size.__setitem__(c, (e.width, e.height)),
+        )
 
-        if sbox_array is None:
-            return
+    @staticmethod
+    def _grid_bboxes(N, grid_size, cell_width, cell_height):
+        """All cell corners as an (N, 4) array, computed in one numpy pass
+
+        Replaces the per-cell row/col divisions and corner multiplications
+        that used to run inside the build loop.
+        """
+        idx = np.arange(N)
+        col = idx % grid_size
+        row = idx // grid_size
+        x1 = col * cell_width
+        y1 = row * cell_height
+        return np.stack(
+            [x1, y1, x1 + cell_width, y1 + cell_height], axis=1
+        )
 
-        N = len(sbox_array)
+    def _build_sbox_grid(self, canvas, N, canvas_width, canvas_height):
+        """Create the full cell grid once and return its item pool.
+
+        Called on the first draw and again only when N or the canvas size
+        changes; every other frame just reconfigures existing items.
+        """
+        canvas.delete("all")
 
-        # Calculate grid dimensions
         grid_size = int(math.sqrt(N))
         if grid_size * grid_size < N:
             grid_size += 1
 
-        # Get canvas dimensions
-        canvas.update_idletasks()
-        canvas_width = canvas.winfo_width()
-        canvas_height = canvas.winfo_height()
+        cell_width = canvas_width / grid_size
+        cell_height = canvas_height / grid_size
+
+        draw_text = (
+            N <= 64
+            and cell_width > 20
+            and cell_height > 15
+            and self.show_values_var.get()
+        )
+
+        if not draw_text:
+            # Large N: the cells are too small for text anyway, so the whole
+            # grid collapses into a single PhotoImage item instead of N
+            # rectangles. The image starts gray and each cell is painted
+            # inset by one pixel, leaving the background as the grid line;
+            # the current-swap frame is two pooled gold rectangles on top.
+            img = tk.PhotoImage(
+                width=int(canvas_width), height=int(canvas_height)
+            )
+            img.put("gray", to=(0, 0, int(canvas_width), int(canvas_height)))
+            img_id = canvas.create_image(0, 0, anchor="nw", image=img)
+
+            inset = self._grid_bboxes(N, grid_size, cell_width, cell_height)
+            inset = inset.astype(int) + np.array([1, 1, -1, -1])
+            bboxes = [tuple(b) for b in inset.tolist()]
+
+            highlights = [
+                canvas.create_rectangle(
+                    0, 0, 0, 0, outline="gold", width=4, state="hidden"
+                )
+                for _ in range(2)
+            ]
+
+            pool = {
+                "mode": "image",
+                "n": N,
+                "w": canvas_width,
+                "h": canvas_height,
+                "img": img,  # keep a reference or Tk drops the image
+                "img_id": img_id,
+                "bboxes": bboxes,
+                "highlights": highlights,
+                "fills": [""] * N,
+            }
+            self._sbox_items[canvas] = pool
+            return pool
+
+        font = ("Courier", max(6, min(10, int(cell_height / 2))))
+
+        _rect = canvas.create_rectangle
+        _text = canvas.create_text
+        rect_ids = []
+        text_ids = []
+
+        for x1, y1, x2, y2 in self._grid_bboxes(
+            N, grid_size, cell_width, cell_height
+        ).tolist():
+            rect_ids.append(
+                _rect(x1, y1, x2, y2, fill="white", outline="gray", width=1)
+            )
+            if draw_text:
+                text_ids.append(
+                    _text(
+                        (x1 + x2) / 2,
+                        (y1 + y2) / 2,
+                        text="",
+                        font=font,
+                        fill="black",
+                    )
+                )
+
+        pool = {
+            "mode": "items",
+            "n": N,
+            "w": canvas_width,
+            "h": canvas_height,
+            "rect_ids": rect_ids,
+            "text_ids": text_ids,
+            "draw_text": draw_text,
+            # Last applied per-cell state, so unchanged cells cost nothing
+            "fills": ["white"] * N,
+            "widths": [1] * N,
+            "texts": [""] * N,
+        }
+        self._sbox_items[canvas] = pool
+        return pool
+
+    def _classify_cells(self, sbox_array, target_sbox, N):
+        """Vectorized correct / was-correct / incorrect classification.
+
+        Three numpy ops instead of N Python compares + memory lookups; the
+        memory mask is updated in place through the slice view. Returns
+        None for the target S-Box (no comparison, all cells white).
+        """
+        if target_sbox is None:
+            return None
+
+        cand = np.asarray(sbox_array, dtype=np.uint8)
+        tgt = np.asarray(target_sbox, dtype=np.uint8)
+        correct = cand == tgt
+        mem = self.memory_correct_mask[:N]
+        color_idx = np.where(correct, 0, np.where(mem, 1, 2))
+        mem |= correct
+        return color_idx
+
+    def _draw_sbox_image(self, canvas, pool, sbox_array, target_sbox, current_swap):
+        """Image-mode redraw: paint only changed cells into the PhotoImage"""
+        N = pool["n"]
+        color_idx = self._classify_cells(sbox_array, target_sbox, N)
+
+        put = pool["img"].put
+        bboxes = pool["bboxes"]
+        fills = pool["fills"]
+
+        for idx in range(N):
+            fill_color = (
+                "white" if color_idx is None else _CELL_COLORS[color_idx[idx]]
+            )
+            if fills[idx] != fill_color:
+                put(fill_color, to=bboxes[idx])
+                fills[idx] = fill_color
+
+        # Gold frame for the current swap: two pooled rectangles above the
+        # image, moved into place or hidden
+        swap = current_swap if current_swap else ()
+        highlights = pool["highlights"]
+        _item = canvas.itemconfigure
+        for k in (0, 1):
+            if k < len(swap):
+                x1, y1, x2, y2 = bboxes[swap[k]]
+                canvas.coords(highlights[k], x1 - 1, y1 - 1, x2 + 1, y2 + 1)
+                _item(highlights[k], state="normal")
+            else:
+                _item(highlights[k], state="hidden")
+
+    def _draw_sbox(self, canvas, sbox_array, target_sbox=None, current_swap=None):
+        """MODIFIED: Incremental S-Box redraw — only changed cells are touched"""
+        if sbox_array is None:
+            return
+
+        N = len(sbox_array)
+
+        # Cached dimensions (refreshed by the <Configure> binding)
+        canvas_width, canvas_height = self._canvas_size.get(canvas, (0, 0))
 
         if canvas_width < 10 or canvas_height < 10:
             canvas_width = 400
             canvas_height = 400
 
-        # Calculate cell size
-        cell_width = canvas_width / grid_size
-        cell_height = canvas_height / grid_size
+        pool = self._sbox_items.get(canvas)
+        if (
+            pool is None
+            or pool["n"] != N
+            or pool["w"] != canvas_width
+            or pool["h"] != canvas_height
+        ):
+            pool = self._build_sbox_grid(canvas, N, canvas_width, canvas_height)
+
+        if pool["mode"] == "image":
+            self._draw_sbox_image(canvas, pool, sbox_array, target_sbox, current_swap)
+            return
 
-        # Draw grid
-        for idx in range(N):
-            row = idx // grid_size
-            col = idx % grid_size
+        rect_ids = pool["rect_ids"]
+        text_ids = pool["text_ids"]
+        fills = pool["fills"]
+        widths = pool["widths"]
+        texts = pool["texts"]
+        draw_text = pool["draw_text"]
 
-            x1 = col * cell_width
-            y1 = row * cell_height
-            x2 = x1 + cell_width
-            y2 = y1 + cell_height
+        color_idx = self._classify_cells(sbox_array, target_sbox, N)
+
+        # Bind hot canvas methods and arrays to locals: these lookups happen
+        # N times per frame otherwise (expensive at N=256). tolist() gives
+        # plain ints, so the text loop indexes _HEX without boxing a numpy
+        # scalar per cell.
+        _item = canvas.itemconfigure
+        _sbox = np.asarray(sbox_array).tolist() if draw_text else sbox_array
 
-            # Determine cell color and border
-            is_swap_cell = current_swap and idx in current_swap
+        # Unpack the swap pair to two scalars: `idx in tuple` would scan a
+        # container N times per frame
+        swap_a, swap_b = current_swap if current_swap else (-1, -1)
 
-            if target_sbox is not None:
+        for idx in range(N):
+            if color_idx is not None:
                 # Candidate S-Box: color based on match and memory
-                is_currently_correct = sbox_array[idx] == target_sbox[idx]
-                was_correct = idx in self.memory_correct
-
-                # Determine fill color (background)
-                if is_currently_correct:
-                    fill_color = "lightgreen"
-                    self.memory_correct.add(idx)  # Add to memory
-                elif was_correct:
-                    fill_color = "orange"  # Was correct before
-                else:
-                    fill_color = "lightcoral"
+                fill_color = _CELL_COLORS[color_idx[idx]]
 
-                # Determine border (outline)
-                if is_swap_cell:
+                if idx == swap_a or idx == swap_b:
                     outline_color = "gold"  # Yellow/gold border for swap
                     outline_width = 4
                 else:
@@ -533,89 +866,126 @@ class TabuAttackGUI(tk.Frame):
                 outline_color = "gray"
                 outline_width = 1
 
-            # Draw cell
-            canvas.create_rectangle(
-                x1,
-                y1,
-                x2,
-                y2,
-                fill=fill_color,
-                outline=outline_color,
-                width=outline_width,
+            # Reconfigure only on change (width changes iff outline does)
+            if fills[idx] != fill_color or widths[idx] != outline_width:
+                _item(
+                    rect_ids[idx],
+                    fill=fill_color,
+                    outline=outline_color,
+                    width=outline_width,
+                )
+                fills[idx] = fill_color
+                widths[idx] = outline_width
+
+            if draw_text:
+                value_text = _HEX[_sbox[idx]]
+                if texts[idx] != value_text:
+                    _item(text_ids[idx], text=value_text)
+                    texts[idx] = value_text
+
+    def _build_keystream_row(self, canvas, display_length, canvas_width):
+        """Create the keystream cell row once and return its item pool"""
+        canvas.delete("all")
+
+        cell_width = canvas_width / display_length
+        _rect = canvas.create_rectangle
+        _text = canvas.create_text
+        rect_ids = []
+        text_ids = []
+
+        for i in range(display_length):
+            x1 = i * cell_width
+            x2 = x1 + cell_width
+            rect_ids.append(_rect(x1, 2, x2, 23, fill="white", outline="gray"))
+            text_ids.append(
+                _text((x1 + x2) / 2, 12, text="", font=("Courier", 9), fill="black")
             )
 
-            # Draw value (only if cell is large enough)
-            if cell_width > 20 and cell_height > 15:
-                value_text = (
-                    f"{sbox_array[idx]:02X}" if N <= 256 else str(sbox_array[idx])
-                )
-                font_size = max(6, min(10, int(cell_height / 2)))
-                canvas.create_text(
-                    (x1 + x2) / 2,
-                    (y1 + y2) / 2,
-                    text=value_text,
-                    font=("Courier", font_size),
-                    fill="black",
-                )
+        pool = {
+            "n": display_length,
+            "w": canvas_width,
+            "rect_ids": rect_ids,
+            "text_ids": text_ids,
+            "fills": ["white"] * display_length,
+            "texts": [""] * display_length,
+        }
+        self._ks_items[canvas] = pool
+        return pool
 
     def _draw_keystream_row(
         self, canvas, target_ks, actual_ks, use_colors=True, use_memory=False
     ):
-        """MODIFIED: Draw a single keystream comparison row with optional coloring and memory"""
-        canvas.delete("all")
-
+        """MODIFIED: Incremental keystream row redraw with optional coloring and memory"""
         if target_ks is None or actual_ks is None:
             return
 
         # Limit display to first 20 bytes
         display_length = min(20, len(target_ks))
 
-        # Get canvas dimensions
-        canvas.update_idletasks()
-        canvas_width = canvas.winfo_width()
+        # Cached dimensions (refreshed by the <Configure> binding)
+        canvas_width = self._canvas_size.get(canvas, (0, 0))[0]
         if canvas_width < 10:
             canvas_width = 600
 
-        cell_width = canvas_width / display_length
+        # Whole-row skip: same bytes, same mode, same size -> same pixels
+        frame_key = (
+            bytes(np.asarray(actual_ks[:display_length], dtype=np.uint8)),
+            use_colors,
+            use_memory,
+            canvas_width,
+        )
+        if self._last_ks_frame.get(canvas) == frame_key:
+            return
+        self._last_ks_frame[canvas] = frame_key
+
+        pool = self._ks_items.get(canvas)
+        if (
+            pool is None
+            or pool["n"] != display_length
+            or pool["w"] != canvas_width
+        ):
+            pool = self._build_keystream_row(canvas, display_length, canvas_width)
+
+        rect_ids = pool["rect_ids"]
+        text_ids = pool["text_ids"]
+        fills = pool["fills"]
+        texts = pool["texts"]
+
+        # Vectorized classification, mirroring _draw_sbox
+        if use_colors:
+            act = np.asarray(actual_ks[:display_length], dtype=np.uint8)
+            tgt = np.asarray(target_ks[:display_length], dtype=np.uint8)
+            correct = act == tgt
+            if use_memory:
+                # Best output: with memory system
+                mem = self.memory_correct_keystream_mask[:display_length]
+                color_idx = np.where(correct, 0, np.where(mem, 1, 2))
+                mem |= correct
+            else:
+                # Simple coloring (no memory)
+                color_idx = np.where(correct, 0, 2)
+        else:
+            color_idx = None
 
-        for i in range(display_length):
-            x1 = i * cell_width
-            x2 = x1 + cell_width
+        # Local binding for the per-byte loop; plain ints for _HEX indexing
+        _item = canvas.itemconfigure
+        act_list = np.asarray(actual_ks[:display_length]).tolist()
 
-            # Determine color
-            if not use_colors:
+        for i in range(display_length):
+            if color_idx is None:
                 # Current output: no colors
                 fill_color = "white"
-            elif use_memory:
-                # Best output: with memory system
-                is_currently_correct = actual_ks[i] == target_ks[i]
-                was_correct = i in self.memory_correct_keystream
-
-                if is_currently_correct:
-                    fill_color = "lightgreen"
-                    self.memory_correct_keystream.add(i)  # Add to memory
-                elif was_correct:
-                    fill_color = "orange"  # Was correct before
-                else:
-                    fill_color = "lightcoral"
             else:
-                # Simple coloring (no memory)
-                if actual_ks[i] == target_ks[i]:
-                    fill_color = "lightgreen"
-                else:
-                    fill_color = "lightcoral"
-
-            # Draw cell
-            canvas.create_rectangle(x1, 2, x2, 23, fill=fill_color, outline="gray")
-
-            # Draw value
-            canvas.create_text(
-                (x1 + x2) / 2,
-                12,
-                text=f"{actual_ks[i]:02X}",
-                font=("Courier", 9),
-                fill="black",
-            )
+                fill_color = _CELL_COLORS[color_idx[i]]
+
+            if fills[i] != fill_color:
+                _item(rect_ids[i], fill=fill_color)
+                fills[i] = fill_color
+
+            value_text = _HEX[act_list[i]]
+            if texts[i] != value_text:
+                _item(text_ids[i], text=value_text)
+                texts[i] = value_text
 
     def _draw_keystream_comparison(self, target_ks, current_ks, best_ks):
         """MODIFIED: Draw all three keystream rows - Target also with boxes"""
@@ -642,22 +1012,33 @@ class TabuAttackGUI(tk.Frame):
             self.best_ks_canvas, target_ks, best_ks, use_colors=True, use_memory=True
         )
 
-    def _update_tabu_list(self, tabu_deque):
-        """Update tabu list display"""
-        self.tabu_listbox.delete(0, tk.END)
-
-        if tabu_deque is None or len(tabu_deque) == 0:
-            return
-
-        # Create a snapshot of the deque to avoid mutation during iteration
-        tabu_snapshot = list(tabu_deque)
-        
-        for move in tabu_snapshot:
-            move_text = f"Swap({move[0]:3d}, {move[1]:3d})"
-            self.tabu_listbox.insert(tk.END, move_text)
+    def _update_tabu_list(self, tabu_moves):
+        """Update tabu list display, touching only the changed suffix.
+
+        While the tabu ring is filling it only grows at the end, so the
+        common prefix covers everything already drawn and each tick costs
+        one insert instead of a full delete + reinsert of the whole list.
+        """
+        new = tuple(tabu_moves)
+        last = self._last_tabu
+
+        # Longest common prefix between the drawn list and the new one
+        p = 0
+        limit = min(len(last), len(new))
+        while p < limit and last[p] == new[p]:
+            p += 1
+
+        if p < len(last):
+            self.tabu_listbox.delete(p, _END)
+        if p < len(new):
+            self.tabu_listbox.insert(
+                _END, *[f"Swap({u:3d}, {v:3d})" for (u, v) in new[p:]]
+            )
+        self._last_tabu = new
 
-        # Auto-scroll to bottom
-        self.tabu_listbox.see(tk.END)
+        if new:
+            # Auto-scroll to bottom
+            self.tabu_listbox.see(_END)
 
     def _start_attack(self):
         """Start the Tabu Search attack"""
@@ -684,9 +1065,11 @@ class TabuAttackGUI(tk.Frame):
                 f"Starting attack: N={N}, length={keystream_length}, max_iter={max_iterations}"
             )
 
-            # Clear previous state
-            self.memory_correct.clear()
-            self.memory_correct_keystream.clear()
+            # Clear previous state (and the frame cache: a new target means
+            # identical bytes may need different colors)
+            self.memory_correct_mask.fill(False)
+            self.memory_correct_keystream_mask.fill(False)
+            self._last_ks_frame.clear()
             self.success_label.config(text="Buscando...", fg="blue")
 
             # Generate challenge
@@ -697,7 +1080,9 @@ class TabuAttackGUI(tk.Frame):
             # Draw target S-Box
             self._draw_sbox(self.target_canvas, self.target_state)
 
-            # Initialize cracker
+            # Initialize cracker, releasing the previous one's worker
+            if self.cracker:
+                self.cracker.shutdown(timeout=0.1)
             self.cracker = TabuCracker(
                 self.target_keystream, N=N, target_state=self.target_state
             )
@@ -713,16 +1098,38 @@ class TabuAttackGUI(tk.Frame):
             if attack_mode == "rapido":
                 delay = 0
                 self.update_interval = 500  # Update UI less frequently in fast mode
+                # The GUI repaints twice a second and coalesces frames, so
+                # most per-iteration stats dicts would be dropped anyway:
+                # let the worker skip building them
+                stats_interval = 25
             else:
                 delay = 0.5
                 self.update_interval = 100  # Update UI more frequently in didactic mode
+                stats_interval = 1
 
-            # Start attack in background
+            # Start attack in background; if the queue is full the GUI is
+            # behind, so evict the oldest pending frame and keep the new
+            # one — dropping the newest would lose the terminal success
+            # frame and leave the GUI stuck on "Buscando..." after a crack
             def callback(stats):
-                self.update_queue.put(stats)
+                try:
+                    self.update_queue.put_nowait(stats)
+                except queue.Full:
+                    try:
+                        self.update_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    # Single producer: after removing one entry (or finding
+                    # the GUI drained the queue) this put cannot fail
+                    self.update_queue.put_nowait(stats)
             
-            self.cracker.run(
-                max_iterations=max_iterations, callback=callback, delay=delay
+            # run() submits the loop to the cracker's persistent worker
+            # and returns its future; keep the handle for bookkeeping
+            self._worker = self.cracker.run(
+                max_iterations=max_iterations,
+                callback=callback,
+                delay=delay,
+                stats_interval=stats_interval,
             )
 
             logger.info("Attack started successfully")
@@ -733,12 +1140,26 @@ class TabuAttackGUI(tk.Frame):
             self.success_label.config(text=f"ERROR: {str(e)}", fg="red")
             self._stop_attack()
 
+    def _on_close(self):
+        """Stop the worker before the window closes.
+
+        The worker lives in the cracker's ThreadPoolExecutor (non-daemon
+        threads), so it must be told to stop or the interpreter would wait
+        on it at exit.
+        """
+        if self.cracker:
+            self.cracker.shutdown(timeout=0.5)
+        self.master.destroy()
+
     def _stop_attack(self):
         """Stop the running attack"""
         self.is_running = False
 
+        # Short join: this runs on the Tk main thread, so never wait the
+        # full second the headless default allows
         if self.cracker:
-            self.cracker.stop()
+            self.cracker.stop(timeout=0.1)
+        self._worker = None
 
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
@@ -754,12 +1175,14 @@ class TabuAttackGUI(tk.Frame):
         if self.is_running:
             self._stop_attack()
 
-        # Clear all state
+        # Clear all state; the discarded cracker releases its worker thread
+        if self.cracker:
+            self.cracker.shutdown(timeout=0.1)
         self.cracker = None
         self.target_state = None
         self.target_keystream = None
-        self.memory_correct.clear()
-        self.memory_correct_keystream.clear()
+        self.memory_correct_mask.fill(False)
+        self.memory_correct_keystream_mask.fill(False)
 
         # Clear queue
         while not self.update_queue.empty():
@@ -774,13 +1197,13 @@ class TabuAttackGUI(tk.Frame):
         self.best_fitness_label.config(text="Mejor Fitness: 0/0")
         self.tabu_size_label.config(text="Tamaño Tabu: 0")
         self.success_label.config(text="")
+        self._last_labels.clear()
+        self._last_tabu = ()
+        self._last_ks_frame.clear()
 
-        # Clear visualizations - MODIFIED to include target_ks_canvas
-        self.target_canvas.delete("all")
-        self.candidate_canvas.delete("all")
-        self.target_ks_canvas.delete("all")
-        self.current_ks_canvas.delete("all")
-        self.best_ks_canvas.delete("all")
+        # Clear visualizations: pooled grids are blanked back to their
+        # default look and kept for the next run
+        self._blank_pools()
         self.tabu_listbox.delete(0, tk.END)
 
         # Enable start button
@@ -795,57 +1218,102 @@ class TabuAttackGUI(tk.Frame):
         self.after(self.update_interval, self._schedule_ui_update)
 
     def _process_update_queue(self):
-        """Process all pending updates from the queue"""
+        """Coalesce pending updates: only the newest stats get drawn.
+
+        Redrawing every queued frame would paint states nobody sees; one
+        full redraw per tick bounds the GUI cost regardless of how fast
+        the search worker produces iterations.
+        """
+        latest = None
         try:
             while True:
-                stats = self.update_queue.get_nowait()
-                self._update_ui(stats)
+                latest = self.update_queue.get_nowait()
         except queue.Empty:
             pass
 
+        if latest is not None:
+            self._update_ui(latest)
+
+    def _set_label(self, label, key, text):
+        """Reconfigure a status label only when its text actually changed"""
+        if self._last_labels.get(key) != text:
+            label.config(text=text)
+            self._last_labels[key] = text
+
     def _update_ui(self, stats):
         """Update UI with current statistics"""
         try:
-            # Update status labels
-            self.iteration_label.config(text=f"Iteración: {stats['iteration']}")
+            # Update status labels (debounced)
+            self._set_label(
+                self.iteration_label, "iteration", f"Iteración: {stats.iteration}"
+            )
 
-            keystream_length = len(stats["target_keystream"])
-            self.fitness_label.config(
-                text=f"Fitness: {stats['current_fitness']}/{keystream_length}"
+            keystream_length = len(stats.target_keystream)
+            self._set_label(
+                self.fitness_label,
+                "fitness",
+                f"Fitness: {stats.current_fitness}/{keystream_length}",
+            )
+            self._set_label(
+                self.best_fitness_label,
+                "best_fitness",
+                f"Mejor Fitness: {stats.best_fitness}/{keystream_length}",
             )
-            self.best_fitness_label.config(
-                text=f"Mejor Fitness: {stats['best_fitness']}/{keystream_length}"
+            self._set_label(
+                self.tabu_size_label, "tabu_size", f"Tamaño Tabu: {stats.tabu_size}"
             )
-            self.tabu_size_label.config(text=f"Tamaño Tabu: {stats['tabu_size']}")
+
+            # Heavy canvas work only while the frame is actually visible;
+            # labels above and the completion check below still run
+            if not self._visible:
+                if stats.best_fitness == keystream_length:
+                    self._stop_attack()
+                    self.success_label.config(
+                        text=f"¡ÉXITO! SOLUCIÓN ENCONTRADA\nEn {stats.iteration} iteraciones",
+                        fg="green",
+                        font=("Arial", 14, "bold"),
+                    )
+                return
+
+            # Coerce once to uint8 ndarrays (no copy when already typed) so
+            # the draw functions can vectorize without re-checking inputs
+            display_candidate = np.asarray(
+                stats.display_candidate
+                if stats.display_candidate is not None
+                else stats.current_candidate,
+                dtype=np.uint8,
+            )
+            target_state = (
+                np.asarray(stats.target_state, dtype=np.uint8)
+                if stats.target_state is not None
+                else None
+            )
+            target_ks = np.asarray(stats.target_keystream, dtype=np.uint8)
+            predicted_ks = np.asarray(stats.predicted_keystream, dtype=np.uint8)
+            best_ks = np.asarray(stats.best_predicted_keystream, dtype=np.uint8)
 
             # Update S-Box visualizations
             # MODIFIED: Use display_candidate (PRE-swap state) for visualization with yellow border
             self._draw_sbox(
                 self.candidate_canvas,
-                stats.get(
-                    "display_candidate", stats["current_candidate"]
-                ),  # Use display_candidate if available
-                target_sbox=stats["target_state"],
-                current_swap=stats.get("current_swap"),
+                display_candidate,
+                target_sbox=target_state,
+                current_swap=stats.current_swap,
             )
 
             # Update keystream comparison (3 rows)
-            self._draw_keystream_comparison(
-                stats["target_keystream"],
-                stats["predicted_keystream"],
-                stats.get("best_predicted_keystream", stats["predicted_keystream"]),
-            )
+            self._draw_keystream_comparison(target_ks, predicted_ks, best_ks)
 
             # Update tabu list
             if self.cracker:
-                self._update_tabu_list(self.cracker.tabu_deque)
+                self._update_tabu_list(self.cracker.get_tabu_moves())
 
             # Check for completion
-            if stats["best_fitness"] == keystream_length:
+            if stats.best_fitness == keystream_length:
                 self._stop_attack()
                 #Show success in GUI instead of messagebox
                 self.success_label.config(
-                    text=f"¡ÉXITO! SOLUCIÓN ENCONTRADA\nEn {stats['iteration']} iteraciones",
+                    text=f"¡ÉXITO! SOLUCIÓN ENCONTRADA\nEn {stats.iteration} iteraciones",
                     fg="green",
                     font=("Arial", 14, "bold"),
                 )
@@ -854,8 +1322,15 @@ class TabuAttackGUI(tk.Frame):
             logger.error(f"Error updating UI: {e}", exc_info=True)
 
     def _show_help(self):
-        """Show help window with mountain metaphor"""
+        """Show help window with mountain metaphor (built once, then reshown)"""
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            self._help_window.grab_set()
+            return
+
         help_window = tk.Toplevel(self.parent)
+        self._help_window = help_window
         help_window.title("Ayuda - Búsqueda Tabú")
         help_window.geometry("700x600")
         help_window.configure(bg=self.bg_color)
@@ -909,54 +1384,28 @@ class TabuAttackGUI(tk.Frame):
         help_text_widget.tag_configure("error", foreground="red")
         help_text_widget.tag_configure("antes_success", foreground="orange")
         help_text_widget.tag_configure("info", foreground="blue")
-        # Get and insert formatted text
-        help_text = show_help_text()
-        for line in help_text.split("\n"):
-            if line.startswith("Ayuda:"):
-                help_text_widget.insert(tk.END, line + "\n\n", "h1")
-            elif line and line[0].isdigit() and "." in line:
-                help_text_widget.insert(tk.END, line + "\n", "h2")
-            elif line.strip().startswith("-"):
-                clean_line = line.strip()[1:].strip()
-                parts = clean_line.split(":", 1)
-
-                if len(parts) == 2:
-                    help_text_widget.insert(tk.END, "• ", "bullet")
-
-                    # Lógica para elegir el icono y color según el texto
-                    key_text = parts[0]
-                    icon = ""
-                    style = ("bullet", "bold")  # Estilo por defecto
-
-                    if "Incorrecto" in key_text:
-                        icon = "✖ "
-                        style = ("bullet", "bold", "error")
-                    elif "Fue Correcto" in key_text:
-                        icon = "⚠️ "
-                        style = ("bullet", "bold", "antes_success")
-                    elif "Correcto" in key_text:
-                        icon = "✔ "
-                        style = ("bullet", "bold", "success")
-                    elif "Intercambio" in key_text:
-                        icon = "⇄ "
-                        style = ("bullet", "bold", "info")
-
-                    # Insertar con el icono y color seleccionado
-                    help_text_widget.insert(tk.END, f"{icon}{key_text}:", style)
-                    help_text_widget.insert(tk.END, f"{parts[1]}\n", "bullet")
-                else:
-                    help_text_widget.insert(tk.END, f"• {clean_line}\n", "bullet")
+        # Insert the pre-classified segments
+        for text, tags in _HELP_SEGMENTS:
+            if tags:
+                help_text_widget.insert(tk.END, text, tags)
             else:
-                help_text_widget.insert(tk.END, line + "\n")
+                help_text_widget.insert(tk.END, text)
 
         # Disable editing
         help_text_widget.config(state="disabled")
 
+        # Closing hides the window so reopening skips the rebuild
+        def _close():
+            help_window.grab_release()
+            help_window.withdraw()
+
+        help_window.protocol("WM_DELETE_WINDOW", _close)
+
         # Close button
         close_button = tk.Button(
             help_window,
             text="Cerrar",
-            command=help_window.destroy,
+            command=_close,
             bg="#2196F3",
             fg="white",
             font=("Arial", 11, "bold"),
@@ -1046,6 +1495,7 @@ def main():
     # Create main frame
     app = TabuAttackGUI(root)
     app.pack(fill="both", expand=True)
+    root.protocol("WM_DELETE_WINDOW", app._on_close)
 
     root.mainloop()
 
@@ -3,19 +3,499 @@ Tabu Search State Recovery Attack - Z2 Configuration
 Implements the exact parameters from Polak & Boryczka (2019) Experiment 2, Set Z2
 """
 
+import concurrent.futures
 import numpy as np
 import threading
 import time
-from collections import deque
 import logging
+from dataclasses import dataclass
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Module-level PCG64 generator (the modern numpy RNG API, faster than the
+# legacy global RandomState for shuffles and integer draws)
+_rng = np.random.default_rng()
 
-def rc4_plus_prga(S, length, N):
+# Numba is optional: when available the PRGA kernel is JIT-compiled to native
+# code (~50-100x on this byte-at-a-time loop); otherwise the same function
+# runs as plain Python.
+try:
+    from numba import get_num_threads, get_thread_id, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed"""
+
+        def decorator(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+    def get_num_threads():
+        """Single worker without numba's parallel runtime"""
+        return 1
+
+    def get_thread_id():
+        """Single worker without numba's parallel runtime"""
+        return 0
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _rc4_plus_prga_kernel(S_work, keystream, length, N, mask, shift_right,
+                          shift_left, shift_up, xor_constant):
+    """
+    RC4+ PRGA inner loop. Mutates S_work in place and fills keystream.
+
+    Kept free of logging, exception handling and attribute lookups so Numba
+    can compile it to a tight native loop; it is also valid plain Python for
+    the no-numba fallback. N is always a power of two (64/128/256), so every
+    `% N` reduction is a single-AND `& mask` with mask = N - 1, and the
+    256/N output scaling is a left shift by shift_up = 8 - log2(N) — one
+    integer code path for every N, no float math.
+
+    idx1/idx2 are computed SWAR-style: i and j are packed into the halves
+    of one 32-bit word, so a single shift pair plus a half-swap produces
+    (i >> sr) ^ (j << sl) in the high half and (i << sl) ^ (j >> sr) in
+    the low half at once. The cross-half bleed bits all land above the
+    N-bit mask (sr + n_bits < 16), so the extracts are exact.
+    """
+    i = 0
+    j = 0
+    for step in range(length):
+        i = (i + 1) & mask
+        j = (j + int(S_work[i])) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (int(S_work[i]) + int(S_work[j])) & mask
+        w = (i << 16) | j
+        ws = (w << shift_left) & 0xFFFFFFFF
+        u = (w >> shift_right) ^ (((ws << 16) & 0xFFFFFFFF) | (ws >> 16))
+        idx1 = (u >> 16) & mask
+        idx2 = u & mask
+
+        t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) & mask
+        t_prime = (t_prime_val ^ xor_constant) & mask
+
+        t_double = (j + int(S_work[j])) & mask
+
+        val1 = ((int(S_work[t]) + int(S_work[t_prime])) << shift_up) & 0xFF
+        output = (val1 ^ ((int(S_work[t_double]) << shift_up) & 0xFF)) & 0xFF
+
+        keystream[step] = output
+
+    return keystream
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _rc4_plus_fitness_kernel(S_work, target, length, N, mask, shift_right,
+                             shift_left, shift_up, xor_constant):
+    """
+    Fused PRGA + fitness: generates each keystream byte and compares it to
+    the target on the fly, returning the match count directly. Avoids
+    writing (and re-reading) a keystream array when only the fitness is
+    needed — the fast path for neighborhood evaluation.
+
+    The compare stays per-step by design: a running match count is what
+    lets the resume kernels restart mid-stream from match_snap and the
+    bounded variant bail out early, which word-packed batch comparison
+    would not allow.
+    """
+    i = 0
+    j = 0
+    matches = 0
+    for step in range(length):
+        i = (i + 1) & mask
+        j = (j + int(S_work[i])) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (int(S_work[i]) + int(S_work[j])) & mask
+        w = (i << 16) | j
+        ws = (w << shift_left) & 0xFFFFFFFF
+        u = (w >> shift_right) ^ (((ws << 16) & 0xFFFFFFFF) | (ws >> 16))
+        idx1 = (u >> 16) & mask
+        idx2 = u & mask
+
+        t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) & mask
+        t_prime = (t_prime_val ^ xor_constant) & mask
+
+        t_double = (j + int(S_work[j])) & mask
+
+        val1 = ((int(S_work[t]) + int(S_work[t_prime])) << shift_up) & 0xFF
+        output = (val1 ^ ((int(S_work[t_double]) << shift_up) & 0xFF)) & 0xFF
+
+        if output == int(target[step]):
+            matches += 1
+
+    return matches
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _rc4_plus_trace_kernel(S_work, keystream, target, first_touch, S_snap,
+                           j_snap, match_snap, length, N, mask, shift_right,
+                           shift_left, shift_up, xor_constant):
+    """
+    Stream kernel that additionally records, for every S-box index, the
+    first step at which the PRGA reads or writes it (via i, j, t, t', t'',
+    idx1 or idx2); indices never touched keep the sentinel value `length`
+    the caller pre-fills. It also snapshots the state entering each step —
+    S_snap[f] is the S-box, j_snap[f] the j register and match_snap[f] the
+    running match count against `target` before step f runs (i entering
+    step f is just f & mask, so it needs no snapshot).
+
+    A swap of (a, b) leaves steps before f = min(first_touch[a],
+    first_touch[b]) byte-identical, and the state entering step f differs
+    from S_snap[f] only in the exchanged values at a and b. The
+    neighborhood evaluation therefore resumes the PRGA from step f instead
+    of step 0 — or skips it entirely when f == length.
+    """
+    i = 0
+    j = 0
+    matches = 0
+    for step in range(length):
+        S_snap[step, :] = S_work
+        j_snap[step] = j
+        match_snap[step] = matches
+
+        i = (i + 1) & mask
+        j = (j + int(S_work[i])) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (int(S_work[i]) + int(S_work[j])) & mask
+        w = (i << 16) | j
+        ws = (w << shift_left) & 0xFFFFFFFF
+        u = (w >> shift_right) ^ (((ws << 16) & 0xFFFFFFFF) | (ws >> 16))
+        idx1 = (u >> 16) & mask
+        idx2 = u & mask
+
+        t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) & mask
+        t_prime = (t_prime_val ^ xor_constant) & mask
+
+        t_double = (j + int(S_work[j])) & mask
+
+        if first_touch[i] > step:
+            first_touch[i] = step
+        if first_touch[j] > step:
+            first_touch[j] = step
+        if first_touch[idx1] > step:
+            first_touch[idx1] = step
+        if first_touch[idx2] > step:
+            first_touch[idx2] = step
+        if first_touch[t] > step:
+            first_touch[t] = step
+        if first_touch[t_prime] > step:
+            first_touch[t_prime] = step
+        if first_touch[t_double] > step:
+            first_touch[t_double] = step
+
+        val1 = ((int(S_work[t]) + int(S_work[t_prime])) << shift_up) & 0xFF
+        output = (val1 ^ ((int(S_work[t_double]) << shift_up) & 0xFF)) & 0xFF
+
+        keystream[step] = output
+        if output == int(target[step]):
+            matches += 1
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _rc4_plus_fitness_resume_kernel(S_work, target, start_step, j0, matches0,
+                                    length, N, mask, shift_right, shift_left,
+                                    shift_up, xor_constant):
+    """
+    Fused PRGA + fitness resumed mid-stream: S_work, j0 and matches0 are
+    the state entering `start_step` (captured by _rc4_plus_trace_kernel),
+    so only the suffix of the keystream is regenerated and compared.
+    """
+    # int() matters for the un-jitted fallback: these arrive as int32
+    # scalars out of the trace snapshot arrays, and the 32-bit masks in
+    # the index computation below would overflow int32 under NumPy's
+    # promotion rules
+    i = int(start_step) & mask
+    j = int(j0)
+    matches = int(matches0)
+    for step in range(start_step, length):
+        i = (i + 1) & mask
+        j = (j + int(S_work[i])) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (int(S_work[i]) + int(S_work[j])) & mask
+        w = (i << 16) | j
+        ws = (w << shift_left) & 0xFFFFFFFF
+        u = (w >> shift_right) ^ (((ws << 16) & 0xFFFFFFFF) | (ws >> 16))
+        idx1 = (u >> 16) & mask
+        idx2 = u & mask
+
+        t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) & mask
+        t_prime = (t_prime_val ^ xor_constant) & mask
+
+        t_double = (j + int(S_work[j])) & mask
+
+        val1 = ((int(S_work[t]) + int(S_work[t_prime])) << shift_up) & 0xFF
+        output = (val1 ^ ((int(S_work[t_double]) << shift_up) & 0xFF)) & 0xFF
+
+        if output == int(target[step]):
+            matches += 1
+
+    return matches
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _rc4_plus_fitness_resume_bound_kernel(S_work, target, start_step, j0,
+                                          matches0, length, limit, N, mask,
+                                          shift_right, shift_left, shift_up,
+                                          xor_constant):
+    """
+    Resume kernel with a fitness bound: stops as soon as the running match
+    count plus the remaining steps can no longer exceed `limit`, returning
+    the (truncated) count. Only valid for lanes whose result is discarded
+    unless it beats `limit` — i.e. tabu moves, which need fitness >
+    best_fitness to aspire; the truncated value stays <= limit so the
+    caller's mask still rejects them.
+    """
+    # int() for the un-jitted fallback, as in the unbounded resume kernel
+    i = int(start_step) & mask
+    j = int(j0)
+    matches = int(matches0)
+    for step in range(start_step, length):
+        i = (i + 1) & mask
+        j = (j + int(S_work[i])) & mask
+        tmp = S_work[i]
+        S_work[i] = S_work[j]
+        S_work[j] = tmp
+
+        t = (int(S_work[i]) + int(S_work[j])) & mask
+        w = (i << 16) | j
+        ws = (w << shift_left) & 0xFFFFFFFF
+        u = (w >> shift_right) ^ (((ws << 16) & 0xFFFFFFFF) | (ws >> 16))
+        idx1 = (u >> 16) & mask
+        idx2 = u & mask
+
+        t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) & mask
+        t_prime = (t_prime_val ^ xor_constant) & mask
+
+        t_double = (j + int(S_work[j])) & mask
+
+        val1 = ((int(S_work[t]) + int(S_work[t_prime])) << shift_up) & 0xFF
+        output = (val1 ^ ((int(S_work[t_double]) << shift_up) & 0xFF)) & 0xFF
+
+        if output == int(target[step]):
+            matches += 1
+        elif matches + (length - step - 1) <= limit:
+            return matches
+
+    return matches
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _partial_shuffle_kernel(perm, k, draws):
+    """
+    Partial Fisher-Yates: uniformly randomize the first k positions of perm
+    against the whole array. Cheaper than np.random.choice(replace=False),
+    which shuffles the full population before slicing; only k swaps happen
+    here and the buffer is reused across iterations.
+
+    `draws` holds k uniform [0, 1) floats pre-drawn by the caller from its
+    seeded Generator; using them instead of numba's internal RNG keeps the
+    whole search driven by one seedable stream, so trajectories really are
+    reproducible per seed (and distinct per TabuPool spawn).
+    """
+    M = perm.shape[0]
+    for idx in range(k):
+        r = idx + int(draws[idx] * (M - idx))
+        tmp = perm[idx]
+        perm[idx] = perm[r]
+        perm[r] = tmp
+
+
+@njit(cache=True, boundscheck=False, nogil=True, parallel=True)
+def _evaluate_neighborhood_kernel(candidate, swaps_i, swaps_j, sel,
+                                  tabu_flags, best_fitness, first_touch,
+                                  S_snap, j_snap, match_snap, base_fitness,
+                                  target, scratch, length, N, mask,
+                                  shift_right, shift_left, shift_up,
+                                  xor_constant, fitness_out):
+    """
+    Evaluate the selected neighbor swaps in parallel.
+
+    `sel` holds swap ids into the parallel swaps_i/swaps_j columns, so no
+    gathered pair array is materialized per iteration — each lane reads
+    its pair straight from the two contiguous int16 tables. Each swap is
+    independent, so the loop is a prange: every
+    lane restores the traced snapshot at f = min(first_touch[a],
+    first_touch[b]) — the first PRGA step the swap can influence — into
+    its thread's row of the preallocated `scratch` (no per-lane
+    allocation), exchanges a and b, and resumes the fused fitness kernel
+    from there.
+    Swaps whose two indices the base trace never touches (f == length)
+    cannot change the keystream, so those lanes reuse base_fitness without
+    running the PRGA at all. Tabu lanes (per-lane tabu_flags) use the
+    bounded resume kernel: their fitness only matters if it beats
+    best_fitness, so they bail out as soon as that becomes impossible.
+    The tabu/aspiration filter itself is still the vectorized mask the
+    caller applies before the argmax.
+    """
+    num_swaps = sel.shape[0]
+    for k in prange(num_swaps):
+        a = swaps_i[sel[k]]
+        b = swaps_j[sel[k]]
+
+        f_a = first_touch[a]
+        f_b = first_touch[b]
+        f = f_a if f_a < f_b else f_b
+
+        if f >= length:
+            fitness = base_fitness
+        else:
+            # Positions a and b were untouched before step f, so the
+            # swapped candidate's state entering f is the snapshot with
+            # just those two values exchanged
+            S_work = scratch[get_thread_id()]
+            S_work[:] = S_snap[f]
+            tmp = S_work[a]
+            S_work[a] = S_work[b]
+            S_work[b] = tmp
+
+            if tabu_flags[k]:
+                fitness = _rc4_plus_fitness_resume_bound_kernel(
+                    S_work, target, f, j_snap[f], match_snap[f], length,
+                    best_fitness, N, mask, shift_right, shift_left,
+                    shift_up, xor_constant
+                )
+            else:
+                fitness = _rc4_plus_fitness_resume_kernel(
+                    S_work, target, f, j_snap[f], match_snap[f], length, N,
+                    mask, shift_right, shift_left, shift_up, xor_constant
+                )
+
+        fitness_out[k] = fitness
+
+
+# Cython fallback: when numba is missing but the compiled extension exists
+# (build instructions in _rc4_prga.pyx), it replaces the pure-Python PRGA
+# kernels and the batch neighborhood pass. The batch runs serially (no
+# prange) but every lane is native code.
+CYTHON_AVAILABLE = False
+if not NUMBA_AVAILABLE:
+    try:
+        from tabu_search._rc4_prga import (
+            evaluate_neighborhood_c,
+            rc4_plus_fitness_c,
+            rc4_plus_prga_c,
+        )
+
+        _rc4_plus_prga_kernel = rc4_plus_prga_c
+        _rc4_plus_fitness_kernel = rc4_plus_fitness_c
+        _evaluate_neighborhood_kernel = evaluate_neighborhood_c
+        CYTHON_AVAILABLE = True
+    except ImportError:
+        pass
+
+
+if not NUMBA_AVAILABLE and not CYTHON_AVAILABLE:
+    # Last-resort pure-Python path: the njit-less kernels above still index
+    # numpy arrays element by element, and every S_work[i] pays numpy's
+    # scalar-dispatch overhead. bytearray indexing returns plain ints, so
+    # the same loop over bytearrays is several times faster for the short
+    # keystreams used here; numpy only appears at the edges.
+
+    def _rc4_plus_prga_bytearray(S_work, keystream, length, N, mask,
+                                 shift_right, shift_left, shift_up,
+                                 xor_constant):
+        """bytearray drop-in for _rc4_plus_prga_kernel (same contract)."""
+        S = bytearray(S_work)
+        out = bytearray(length)
+        i = 0
+        j = 0
+        for step in range(length):
+            i = (i + 1) & mask
+            j = (j + S[i]) & mask
+            S[i], S[j] = S[j], S[i]
+
+            t = (S[i] + S[j]) & mask
+            idx1 = ((i >> shift_right) ^ (j << shift_left)) & mask
+            idx2 = ((i << shift_left) ^ (j >> shift_right)) & mask
+
+            t_prime = (((S[idx1] + S[idx2]) & mask) ^ xor_constant) & mask
+            t_double = (j + S[j]) & mask
+
+            val1 = ((S[t] + S[t_prime]) << shift_up) & 0xFF
+            out[step] = (val1 ^ ((S[t_double] << shift_up) & 0xFF)) & 0xFF
+
+        keystream[:] = np.frombuffer(out, dtype=np.uint8)
+        S_work[:] = np.frombuffer(S, dtype=np.uint8)
+        return keystream
+
+    def _rc4_plus_fitness_bytearray(S_work, target, length, N, mask,
+                                    shift_right, shift_left, shift_up,
+                                    xor_constant):
+        """bytearray drop-in for _rc4_plus_fitness_kernel (same contract)."""
+        S = bytearray(S_work)
+        tgt = bytes(target)
+        i = 0
+        j = 0
+        matches = 0
+        for step in range(length):
+            i = (i + 1) & mask
+            j = (j + S[i]) & mask
+            S[i], S[j] = S[j], S[i]
+
+            t = (S[i] + S[j]) & mask
+            idx1 = ((i >> shift_right) ^ (j << shift_left)) & mask
+            idx2 = ((i << shift_left) ^ (j >> shift_right)) & mask
+
+            t_prime = (((S[idx1] + S[idx2]) & mask) ^ xor_constant) & mask
+            t_double = (j + S[j]) & mask
+
+            val1 = ((S[t] + S[t_prime]) << shift_up) & 0xFF
+            output = (val1 ^ ((S[t_double] << shift_up) & 0xFF)) & 0xFF
+
+            if output == tgt[step]:
+                matches += 1
+
+        return matches
+
+    _rc4_plus_prga_kernel = _rc4_plus_prga_bytearray
+    _rc4_plus_fitness_kernel = _rc4_plus_fitness_bytearray
+
+
+def _prga_constants(N):
+    """
+    Derive the N-dependent PRGA constants as a tuple
+    (mask, shift_right, shift_left, shift_up, xor_constant).
+    """
+    n_bits = int(np.ceil(np.log2(N)))
+    shift_right = max(1, n_bits // 3)
+    shift_left = max(1, n_bits - shift_right)
+    shift_up = 8 - n_bits
+    xor_constant = (0xAA * N) >> 8
+    return N - 1, shift_right, shift_left, shift_up, xor_constant
+
+
+# Constants for the S-box sizes the GUI offers, precomputed at import time;
+# any other power of two falls back to computing them on the fly
+_PRGA_CONSTS = {n: _prga_constants(n) for n in (64, 128, 256)}
+
+# Cap on the per-cracker fitness memo in _calculate_fitness; entries are
+# N bytes plus an int, so even at N=256 this stays well under a megabyte
+_FITNESS_CACHE_SIZE = 1024
+
+
+def rc4_plus_prga(S, length, N, scratch=None, out=None):
     """
     Generates a keystream from a given RC4+ state (S-box).
     This centralized function uses modulo N for all index calculations to support
@@ -25,61 +505,35 @@ def rc4_plus_prga(S, length, N):
         S (np.array): The S-box state permutation.
         length (int): The number of keystream bytes to generate.
         N (int): The size of the S-box.
+        scratch (np.array): optional preallocated working S-box of size N;
+            S is copied into it instead of allocating a fresh copy. The
+            buffer is clobbered by the call.
+        out (np.array): optional preallocated uint8 output of size length;
+            when given it is filled and returned instead of a new array.
 
     Returns:
         np.array: The generated keystream.
     """
+    mask = N - 1
+    if N & mask:
+        raise ValueError(f"N must be a power of two. Got: {N}")
 
-    S_work = S.copy()
-    i, j = 0, 0 
-    keystream = np.zeros(length, dtype=np.uint8)
-
-    n_bits = int(np.ceil(np.log2(N)))
-
-    for step in range(length):
-        try:
-            i = (i + 1) % N
-            j = (j + int(S_work[i])) % N  
-            S_work[i], S_work[j] = S_work[j], S_work[i]
-
-            t = (int(S_work[i]) + int(S_work[j])) % N 
-            shift_right = max(1, n_bits // 3)  
-            shift_left = max(1, n_bits - shift_right) 
-            idx1 = ((int(i) >> shift_right) ^ (int(j) << shift_left)) % N
-            idx2 = ((int(i) << shift_left) ^ (int(j) >> shift_right)) % N
-
-            
-            if idx1 >= N or idx2 >= N:
-                logger.error(f"INDEX OUT OF BOUNDS! idx1={idx1}, idx2={idx2}, N={N}")
-                raise IndexError(
-                    f"Calculated index out of bounds: idx1={idx1}, idx2={idx2}, N={N}"
-                )
-
-            t_prime_val = (int(S_work[idx1]) + int(S_work[idx2])) % N
-            xor_constant = (0xAA * N) // 256
-            t_prime = (t_prime_val ^ xor_constant) % N
-
-            t_double = (int(j) + int(S_work[j])) % N
-            
-            if N < 256:
-                scale_factor = 256.0 / N
-                val1 = (
-                    int((S_work[t] * scale_factor + S_work[t_prime] * scale_factor))
-                    & 0xFF
-                )
-                output = (val1 ^ int(S_work[t_double] * scale_factor)) & 0xFF
-            else:
-                val1 = (int(S_work[t]) + int(S_work[t_prime])) & 0xFF
-                output = (val1 ^ int(S_work[t_double])) & 0xFF
-
-            keystream[step] = output
-
-        except Exception as e:
-            logger.error(f"ERROR at step {step}: {e}", exc_info=True)
-            logger.error(f"State at error: i={i}, j={j}, N={N}")
-            logger.error(f"S_work min={S_work.min()}, max={S_work.max()}")
-            raise
-
+    if scratch is None:
+        S_work = S.copy()
+    else:
+        np.copyto(scratch, S)
+        S_work = scratch
+    keystream = np.empty(length, dtype=np.uint8) if out is None else out
+
+    consts = _PRGA_CONSTS.get(N)
+    if consts is None:
+        consts = _prga_constants(N)
+    mask, shift_right, shift_left, shift_up, xor_constant = consts
+
+    _rc4_plus_prga_kernel(
+        S_work, keystream, length, N, mask, shift_right, shift_left,
+        shift_up, xor_constant
+    )
     return keystream
 
 
@@ -100,25 +554,42 @@ def generate_rc4_plus_keystream(N, length):
     if N not in [64, 128, 256]:
         raise ValueError(f"N must be 64, 128, or 256. Got: {N}")
 
-    if N <= 256:
-        dtype = np.uint8
-    else:
-        dtype = np.uint16
+    # Every supported N fits an 8-bit S-box entry
+    target_state = np.arange(N, dtype=np.uint8)
+    _rng.shuffle(target_state)
 
-    target_state = np.arange(N, dtype=dtype)
-    np.random.shuffle(target_state)
+    target_keystream = rc4_plus_prga(target_state, length, N)
+    logger.info("Keystream generation completed successfully")
+    return target_state, target_keystream
 
 
-    try:
-        target_keystream = rc4_plus_prga(target_state, length, N)
-        logger.info("Keystream generation completed successfully")
-        return target_state, target_keystream
-    except Exception as e:
-        logger.error(f"Failed to generate keystream: {e}", exc_info=True)
-        raise
+generate_challenge = generate_rc4_plus_keystream
 
 
-generate_challenge = generate_rc4_plus_keystream
+@dataclass(slots=True)
+class TabuStats:
+    """
+    Per-iteration snapshot handed to the step()/run() callback.
+
+    step() double-buffers two instances and rewrites their fields in
+    place, so no dict (and none of its string-keyed inserts) is allocated
+    per iteration. A frame stays valid until the iteration after next;
+    the GUI coalesces to the newest frame anyway.
+    """
+
+    iteration: int = 0
+    current_fitness: int = 0
+    best_fitness: int = 0
+    tabu_size: int = 0
+    move_accepted: object = None
+    best_candidate: object = None
+    current_candidate: object = None
+    display_candidate: object = None
+    target_state: object = None
+    predicted_keystream: object = None
+    best_predicted_keystream: object = None
+    target_keystream: object = None
+    current_swap: object = None
 
 
 class TabuCracker:
@@ -126,7 +597,8 @@ class TabuCracker:
     Tabu Search attack to recover RC4+ internal state (S-box permutation)
     """
 
-    def __init__(self, target_keystream, N=256, target_state=None):
+    def __init__(self, target_keystream, N=256, target_state=None, seed=None,
+                 initial_candidate=None):
         """
         Initialize Tabu Search cracker
 
@@ -134,6 +606,10 @@ class TabuCracker:
             target_keystream: numpy array of target keystream bytes to match
             N: size of S-box (64, 128, or 256)
             target_state: optional, the actual target S-box for visualization
+            seed: optional seed for the search RNG (reproducible benchmarks)
+            initial_candidate: optional starting permutation of 0..N-1; when
+                omitted a random one is drawn from the search RNG. Used by
+                TabuPool, which generates all trajectory starts in one batch
         """
         logger.info(
             f"Initializing TabuCracker: N={N}, keystream_length={len(target_keystream)}"
@@ -146,27 +622,101 @@ class TabuCracker:
         self.target_keystream = np.array(target_keystream, dtype=np.uint8)
         self.keystream_length = len(target_keystream)
 
+        # The target arrays never change during the search: mark them
+        # read-only and hand out views instead of copying them into every
+        # stats dict
+        self.target_keystream.setflags(write=False)
+
+        # PRGA constants: functions of N only, looked up from the
+        # precomputed module table
+        consts = _PRGA_CONSTS.get(N)
+        if consts is None:
+            consts = _prga_constants(N)
+        (self._mask, self._shift_r, self._shift_l, self._shift_up,
+         self._xor_const) = consts
+
         self.target_state = target_state.copy() if target_state is not None else None
+        if self.target_state is not None:
+            self.target_state.setflags(write=False)
         self.total_swaps = (N * (N - 1)) // 2
         self.swaps_per_iteration = self.total_swaps // 2
         self.tabu_horizon = self.swaps_per_iteration
 
-        self.all_swaps = np.array(
-            [(i, j) for i in range(N) for j in range(i + 1, N)], dtype=np.int32
-        )
-
-        dtype = np.uint8 if N <= 256 else np.uint16
-        self.current_candidate = np.arange(N, dtype=dtype)
-        np.random.shuffle(self.current_candidate)
-
+        # All (i, j) pairs with i < j, structure-of-arrays: two parallel
+        # contiguous int16 columns instead of an (M, 2) int32 matrix —
+        # half the footprint, and the kernel's column reads stay contiguous
+        rows, cols = np.triu_indices(N, k=1)
+        self.swaps_i = rows.astype(np.int16)
+        self.swaps_j = cols.astype(np.int16)
+
+        # Upper-triangle lookup (i, j) -> swap id, the inverse of the
+        # swaps_i/swaps_j tables
+        self._swap_id = np.full((N, N), -1, dtype=np.int32)
+        self._swap_id[rows, cols] = np.arange(self.total_swaps, dtype=np.int32)
+
+        # Persistent index permutation reused by the partial Fisher-Yates
+        # sampler in _get_random_swaps
+        self._swap_perm = np.arange(self.total_swaps, dtype=np.int32)
+
+        self._rng = np.random.default_rng(seed)
+
+        # uint8 unconditionally: every supported N fits an 8-bit entry,
+        # and a single dtype keeps one JIT specialization per kernel
+        if initial_candidate is not None:
+            self.current_candidate = np.array(initial_candidate, dtype=np.uint8)
+        else:
+            self.current_candidate = np.arange(N, dtype=np.uint8)
+            self._rng.shuffle(self.current_candidate)
+
+        # The best-so-far arrays are rebound (never mutated in place) on
+        # improvement only, so they are kept read-only and handed out as
+        # views instead of being copied into every stats dict
         self.best_candidate = self.current_candidate.copy()
+        self.best_candidate.setflags(write=False)
+
+        # Preallocated scratch buffers so neighbor evaluation does not
+        # allocate: the S-box working copy and the generated keystream
+        self._scratch = np.empty(N, dtype=np.uint8)
+        self._ks_buf = np.empty(self.keystream_length, dtype=np.uint8)
+
+        # Per-iteration trace of the base run: first step each S-box index
+        # is touched, plus per-step snapshots (S-box, j, match count) so a
+        # neighbor swap only re-simulates the keystream suffix it can
+        # actually change — and swaps entirely outside the trace inherit
+        # the current fitness for free
+        self._first_touch = np.empty(N, dtype=np.int32)
+        self._s_snap = np.empty((self.keystream_length, N), dtype=np.uint8)
+        self._j_snap = np.empty(self.keystream_length, dtype=np.int32)
+        self._match_snap = np.empty(self.keystream_length, dtype=np.int32)
+
+        # One neighbor S-box row per worker thread plus a reusable fitness
+        # buffer, so the neighborhood pass itself allocates nothing
+        self._neighbor_scratch = np.empty((get_num_threads(), N), dtype=np.uint8)
+        self._fitness_out = np.empty(self.swaps_per_iteration, dtype=np.int64)
+
+        # Uniform draws for the swap sampler, refilled in place from
+        # self._rng each iteration so the sampling follows the seed too
+        self._rand_buf = np.empty(self.swaps_per_iteration, dtype=np.float64)
+
+        # Bounded fitness memo keyed by the raw candidate bytes. The JIT
+        # neighborhood pass computes its lane fitnesses inside the batch
+        # kernel and never reaches this cache by design — it only serves
+        # the Python-level call sites (initial fitness, restarts, pool
+        # adoptions), where trajectories do revisit known permutations
+        self._fitness_cache = {}
 
         logger.info("Calculating initial fitness...")
         self.best_fitness = self._calculate_fitness(self.best_candidate)
         logger.info(f"Initial fitness: {self.best_fitness}/{self.keystream_length}")
 
-        self.tabu_deque = deque(maxlen=self.tabu_horizon)
-        self.tabu_set = set()
+        # Tabu bookkeeping: a dense bool bitmap indexed by swap id for O(1)
+        # membership plus a ring buffer of swap ids that replaces the
+        # deque/set pair — no tuple hashing or allocation, and the bitmap
+        # gathers directly against the selected swap indices each iteration
+        self._tabu_bitmap = np.zeros(self.total_swaps, dtype=np.bool_)
+        self._tabu_ring = np.empty(self.tabu_horizon, dtype=np.int32)
+        self._tabu_head = 0
+        self._tabu_count = 0
 
         self.iteration = 0
         self.current_fitness = self.best_fitness
@@ -177,181 +727,345 @@ class TabuCracker:
         )
 
         self.best_predicted_keystream = self.current_predicted_keystream.copy()
+        self.best_predicted_keystream.setflags(write=False)
 
         self.current_swap = None
 
-        # Threading
+        # Threading: a persistent single-slot worker pool, created on the
+        # first run() and reused across start/stop cycles instead of
+        # spawning a fresh Thread per attack session
         self.running = False
-        self.thread = None
+        self._executor = None
+        self._run_future = None
         self.lock = threading.Lock()
 
+        # Double-buffered stats frames rewritten in place by step()
+        self._stats_buffers = (TabuStats(), TabuStats())
+        self._stats_idx = 0
+
     def _generate_keystream(self, S):
         """
         Generate keystream from a candidate S-box permutation.
-        Now calls the centralized, corrected PRGA function.
+        Now calls the centralized, corrected PRGA function, reusing the
+        preallocated working S-box so no copy is made per call.
         """
-        return rc4_plus_prga(S, self.keystream_length, self.N)
+        return rc4_plus_prga(S, self.keystream_length, self.N, scratch=self._scratch)
 
     def _calculate_fitness(self, candidate):
         """
         Z2 Fitness Function: Byte Fitness
         Counts exact matches between generated and target keystream.
-        """
-        try:
-            candidate_keystream = self._generate_keystream(candidate)
-            matches = np.sum(candidate_keystream == self.target_keystream)
-            return int(matches)
-        except Exception as e:
-            logger.error(f"Error in _calculate_fitness: {e}", exc_info=True)
-            raise
 
-    def _get_random_swaps(self):
-        """
-        Z2 Neighborhood: Generate 50% of all possible swaps randomly
+        Copies the candidate into the preallocated scratch S-box and runs
+        the fused PRGA+compare kernel, which returns the match count
+        without ever materializing a keystream array (or a boolean
+        comparison temporary); _generate_keystream remains only for the
+        paths that need the actual bytes (visualization).
+
+        Results are memoized in a bounded FIFO dict keyed by the candidate
+        bytes (hashed at C speed), so re-evaluating an already-visited
+        permutation — pool adoptions, restarts — skips the kernel entirely.
         """
-        # Ensure we don't try to select more swaps than exist
-        num_swaps = min(self.swaps_per_iteration, len(self.all_swaps))
-        selected_indices = np.random.choice(
-            len(self.all_swaps), size=num_swaps, replace=False
+        key = candidate.tobytes()
+        cached = self._fitness_cache.get(key)
+        if cached is not None:
+            return cached
+
+        np.copyto(self._scratch, candidate)
+        fitness = int(
+            _rc4_plus_fitness_kernel(
+                self._scratch,
+                self.target_keystream,
+                self.keystream_length,
+                self.N,
+                self._mask,
+                self._shift_r,
+                self._shift_l,
+                self._shift_up,
+                self._xor_const,
+            )
         )
-        swaps = self.all_swaps[selected_indices]
-        return swaps
 
-    def _apply_swap(self, candidate, i, j):
-        """
-        Apply swap to candidate and return new state
+        if len(self._fitness_cache) >= _FITNESS_CACHE_SIZE:
+            # dicts iterate in insertion order, so this evicts the oldest
+            del self._fitness_cache[next(iter(self._fitness_cache))]
+        self._fitness_cache[key] = fitness
+        return fitness
+
+    def _get_random_swaps(self):
         """
-        # Validate indices are within bounds
-        if i >= self.N or j >= self.N or i < 0 or j < 0:
-            logger.error(f"Swap indices ({i}, {j}) out of bounds for N={self.N}")
-            raise IndexError(f"Swap indices ({i}, {j}) out of bounds for N={self.N}")
+        Z2 Neighborhood: select 50% of all possible swaps randomly.
 
-        neighbor = candidate.copy()
-        neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
-        return neighbor
+        Returns swap ids (a view of the shared permutation buffer, valid
+        until the next call) rather than the gathered pairs, so no
+        per-iteration copy of the swap table is made.
+        """
+        # Ensure we don't try to select more swaps than exist
+        num_swaps = min(self.swaps_per_iteration, self.total_swaps)
+        draws = self._rand_buf[:num_swaps]
+        self._rng.random(out=draws)
+        _partial_shuffle_kernel(self._swap_perm, num_swaps, draws)
+        return self._swap_perm[:num_swaps]
 
-    def _add_to_tabu(self, move):
+    def _add_to_tabu(self, swap_id):
         """
-        Add move to tabu list
+        Add a swap (by its id in the swap tables) to the tabu list, evicting the
+        oldest move when full
         """
-        if len(self.tabu_deque) >= self.tabu_horizon:
-            oldest = self.tabu_deque[0]
-            self.tabu_set.discard(oldest)
-
-        self.tabu_deque.append(move)
-        self.tabu_set.add(move)
+        if self._tabu_count == self.tabu_horizon:
+            # Ring is full: the slot we are about to overwrite holds the
+            # oldest move — clear its bit first
+            self._tabu_bitmap[self._tabu_ring[self._tabu_head]] = False
+        else:
+            self._tabu_count += 1
+
+        self._tabu_ring[self._tabu_head] = swap_id
+        self._tabu_bitmap[swap_id] = True
+        self._tabu_head += 1
+        if self._tabu_head == self.tabu_horizon:
+            self._tabu_head = 0
 
     def _is_tabu(self, move):
         """
         Check if move is tabu
         """
-        return move in self.tabu_set
+        return bool(self._tabu_bitmap[self._swap_id[move[0], move[1]]])
 
-    def step(self):
+    def get_tabu_moves(self):
         """
-        Perform ONE iteration of Tabu Search (Z2 Configuration)
+        Decode the ring buffer into a list of (i, j) moves, oldest first.
+        Used by the GUI to display the current tabu list.
         """
-        with self.lock:
+        count = self._tabu_count
+        if count == 0:
+            return []
 
-            previous_candidate = self.current_candidate.copy()
-            swaps_to_check = self._get_random_swaps()
-            best_neighbor = None
-            best_neighbor_fitness = -1
-            best_move = None
-
-            for swap_idx, (i, j) in enumerate(swaps_to_check):
-                move = (int(i), int(j))
-
-                # Validate indices before applying swap
-                if i >= self.N or j >= self.N:
-                    logger.warning(f"Skipping invalid swap: ({i}, {j}), N={self.N}")
-                    continue
-
-                try:
-                    neighbor = self._apply_swap(self.current_candidate, i, j)
-                    fitness = self._calculate_fitness(neighbor)
-                except Exception as e:
-                    logger.error(
-                        f"Error processing swap ({i}, {j}): {e}", exc_info=True
-                    )
-                    raise
+        start = (self._tabu_head - count) % self.tabu_horizon
+        positions = (start + np.arange(count)) % self.tabu_horizon
+        ids = self._tabu_ring[positions]
+        return list(zip(self.swaps_i[ids].tolist(), self.swaps_j[ids].tolist()))
 
-                is_tabu = self._is_tabu(move)
-                aspiration_met = fitness > self.best_fitness
+    def step(self, collect_stats=True):
+        """
+        Perform ONE iteration of Tabu Search (Z2 Configuration)
 
-                if not is_tabu or aspiration_met:
-                    if fitness > best_neighbor_fitness:
-                        best_neighbor_fitness = fitness
-                        best_neighbor = neighbor
-                        best_move = move
+        Args:
+            collect_stats: when False (headless runs with no callback), the
+                stats dict and all its array copies are skipped and the
+                method returns None
+        """
+        with self.lock:
 
-            if best_neighbor is not None:
-                # Aplicar el swap al estado interno (NUEVO)
-                self.current_candidate = best_neighbor
-                self.current_fitness = best_neighbor_fitness
+            previous_candidate = (
+                self.current_candidate.copy() if collect_stats else None
+            )
+            selected = self._get_random_swaps()
+
+            # One traced base run per iteration: records when each S-box
+            # index is first read and snapshots the per-step state, so the
+            # neighborhood pass below resumes mid-stream (or skips
+            # keystream-neutral swaps outright)
+            np.copyto(self._scratch, self.current_candidate)
+            self._first_touch[:] = self.keystream_length
+            _rc4_plus_trace_kernel(
+                self._scratch,
+                self._ks_buf,
+                self.target_keystream,
+                self._first_touch,
+                self._s_snap,
+                self._j_snap,
+                self._match_snap,
+                self.keystream_length,
+                self.N,
+                self._mask,
+                self._shift_r,
+                self._shift_l,
+                self._shift_up,
+                self._xor_const,
+            )
+
+            # Evaluate the whole neighborhood in one (parallel) kernel
+            # call; the per-lane tabu flags let tabu lanes cut their PRGA
+            # short once they can no longer aspire
+            tabu_flags = self._tabu_bitmap[selected]
+            fitness_out = self._fitness_out[: len(selected)]
+            _evaluate_neighborhood_kernel(
+                self.current_candidate,
+                self.swaps_i,
+                self.swaps_j,
+                selected,
+                tabu_flags,
+                self.best_fitness,
+                self._first_touch,
+                self._s_snap,
+                self._j_snap,
+                self._match_snap,
+                self.current_fitness,
+                self.target_keystream,
+                self._neighbor_scratch,
+                self.keystream_length,
+                self.N,
+                self._mask,
+                self._shift_r,
+                self._shift_l,
+                self._shift_up,
+                self._xor_const,
+                fitness_out,
+            )
+
+            # Tabu filter as a single vectorized mask outside the kernel:
+            # tabu moves that do not aspire (fitness <= best) drop to -1 so
+            # the argmax skips them
+            fitness_out[tabu_flags & (fitness_out <= self.best_fitness)] = -1
+
+            # The winner is carried as scalars (fitness + swap indices); the
+            # new state is produced by applying that swap in place on
+            # current_candidate — no neighbor array is ever materialized
+            best_idx = int(np.argmax(fitness_out))
+            best_fit = int(fitness_out[best_idx])
+
+            if best_fit >= 0:
+                best_id = int(selected[best_idx])
+                best_i = int(self.swaps_i[best_id])
+                best_j = int(self.swaps_j[best_id])
+                best_move = (best_i, best_j)
+
+                candidate = self.current_candidate
+                candidate[best_i], candidate[best_j] = (
+                    candidate[best_j],
+                    candidate[best_i],
+                )
+                self.current_fitness = best_fit
                 self.current_swap = best_move
 
-                # Update predicted keystream for visualization
-                self.current_predicted_keystream = self._generate_keystream(
-                    self.current_candidate
-                )
+                # The predicted keystream exists only for visualization:
+                # regenerate it per iteration only when stats are collected
+                if collect_stats:
+                    self.current_predicted_keystream = self._generate_keystream(
+                        candidate
+                    )
 
-                if best_neighbor_fitness > self.best_fitness:
+                if best_fit > self.best_fitness:
                     logger.info(
-                        f"New best fitness: {best_neighbor_fitness}/{self.keystream_length} "
+                        f"New best fitness: {best_fit}/{self.keystream_length} "
                         f"(iteration {self.iteration + 1})"
                     )
-                    self.best_candidate = best_neighbor.copy()
-                    self.best_fitness = best_neighbor_fitness
-                    self.best_predicted_keystream = (
-                        self.current_predicted_keystream.copy()
-                    )
-
-                self._add_to_tabu(best_move)
+                    new_best = candidate.copy()
+                    new_best.setflags(write=False)
+                    self.best_candidate = new_best
+                    self.best_fitness = best_fit
+                    # Headless runs still refresh the best keystream (one
+                    # PRGA per improvement, not per iteration) so the final
+                    # result stays reportable. current_predicted_keystream
+                    # is rebound to a fresh array every iteration, so the
+                    # best keystream can share it without copying.
+                    if collect_stats:
+                        self.best_predicted_keystream = (
+                            self.current_predicted_keystream
+                        )
+                    else:
+                        self.best_predicted_keystream = self._generate_keystream(
+                            candidate
+                        )
+                    self.best_predicted_keystream.setflags(write=False)
+
+                self._add_to_tabu(best_id)
+            else:
+                best_move = None
 
             self.iteration += 1
 
+            if not collect_stats:
+                return None
+
             # MODIFICADO: Devolver el estado ANTERIOR para visualización
-            return {
-                "iteration": self.iteration,
-                "current_fitness": self.current_fitness,
-                "best_fitness": self.best_fitness,
-                "tabu_size": len(self.tabu_deque),
-                "move_accepted": best_move,
-                "best_candidate": self.best_candidate.copy(),
-                "current_candidate": self.current_candidate.copy(),  # Estado NUEVO (post-swap)
-                "display_candidate": previous_candidate,  # Estado VIEJO (pre-swap) para visualización
-                "target_state": (
-                    self.target_state.copy() if self.target_state is not None else None
-                ),
-                "predicted_keystream": self.current_predicted_keystream.copy(),
-                "best_predicted_keystream": self.best_predicted_keystream.copy(),
-                "target_keystream": self.target_keystream.copy(),
-                "current_swap": self.current_swap,
-            }
+            return self._fill_stats(best_move, previous_candidate)
 
-    def run(self, max_iterations=1000, callback=None, delay=0.001):
+    def _fill_stats(self, move_accepted, display_candidate):
+        """
+        Rewrite the next stats buffer in place and return it. The integer
+        fields change every frame; the arrays are either per-frame copies
+        (current/display candidate), rebound fresh objects (predicted
+        keystream) or long-lived read-only views (targets, best-so-far).
+        """
+        stats = self._stats_buffers[self._stats_idx]
+        self._stats_idx ^= 1
+
+        stats.iteration = self.iteration
+        stats.current_fitness = self.current_fitness
+        stats.best_fitness = self.best_fitness
+        stats.tabu_size = self._tabu_count
+        stats.move_accepted = move_accepted
+        stats.best_candidate = self.best_candidate  # solo cambia al mejorar
+        stats.current_candidate = self.current_candidate.copy()  # post-swap
+        stats.display_candidate = display_candidate  # pre-swap, para visualización
+        stats.target_state = self.target_state  # vista de solo lectura
+        stats.predicted_keystream = self.current_predicted_keystream
+        stats.best_predicted_keystream = self.best_predicted_keystream
+        stats.target_keystream = self.target_keystream  # vista de solo lectura
+        stats.current_swap = self.current_swap
+        return stats
+
+    def _snapshot_stats(self):
+        """
+        Build a stats frame from the current state without advancing the
+        search. Used by run() to deliver the final frame when the search
+        finishes on an iteration whose stats were skipped.
+        """
+        with self.lock:
+            self.current_predicted_keystream = self._generate_keystream(
+                self.current_candidate
+            )
+            return self._fill_stats(
+                self.current_swap, self.current_candidate.copy()
+            )
+
+    def run(self, max_iterations=1000, callback=None, delay=0,
+            stats_interval=1):
         """
         Run Tabu Search for multiple iterations in background thread
 
         Args:
             max_iterations: Maximum number of iterations
             callback: Optional callback function for progress updates
-            delay: Delay between iterations in seconds (0 for maximum speed)
+            delay: Delay between iterations in seconds. Defaults to 0 (full
+                speed); the old 1 ms default capped the search at ~1000
+                iterations/s regardless of the actual work per step. Pass a
+                positive value only to deliberately slow the search down
+                (didactic mode).
+            stats_interval: invoke the callback (and build its stats dict)
+                only every Nth iteration. The GUI repaints at a fixed tick
+                and coalesces frames anyway, so fast mode can run most
+                iterations without per-step dict construction and array
+                copies. The final iteration always reports.
+
+        Returns:
+            concurrent.futures.Future for the search loop.
         """
 
         def _run_loop():
             self.running = True
-            for _ in range(max_iterations):
-                if not self.running:
-                    break
-
-                stats = self.step()
+            iterations_left = max_iterations
+            while iterations_left > 0 and self.running:
+                iterations_left -= 1
+
+                # Without a callback nobody consumes the stats — and with a
+                # sparse stats_interval most iterations skip the dict
+                # construction and array copies too
+                collect = (
+                    callback is not None
+                    and iterations_left % stats_interval == 0
+                )
+                stats = self.step(collect_stats=collect)
 
-                if callback:
+                if collect:
                     callback(stats)
 
                 if self.best_fitness == self.keystream_length:
+                    if callback is not None and not collect:
+                        # Success landed on a skipped frame: report it
+                        # anyway so the GUI sees the winning state
+                        callback(self._snapshot_stats())
                     break
 
                 # Only sleep if delay > 0
@@ -360,14 +1074,54 @@ class TabuCracker:
 
             self.running = False
 
-        self.thread = threading.Thread(target=_run_loop, daemon=True)
-        self.thread.start()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tabu-search"
+            )
+        self._run_future = self._executor.submit(_run_loop)
+        return self._run_future
 
-    def stop(self):
-        """Stop the running search"""
+    def stop(self, timeout=1.0):
+        """Stop the running search
+
+        Args:
+            timeout: maximum seconds to wait for the worker; GUI callers
+                pass a small value so the Tk loop never stalls
+        """
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
+        if self._run_future is not None:
+            concurrent.futures.wait([self._run_future], timeout=timeout)
+
+    def shutdown(self, timeout=1.0):
+        """
+        Stop the search and release the persistent worker thread. Call
+        when the cracker is discarded (reset, window close) so no worker
+        lingers past the search it served.
+        """
+        self.stop(timeout=timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._run_future = None
+
+    def restart_from(self, candidate):
+        """
+        Restart the trajectory from the given S-box permutation.
+
+        Keeps the best-so-far records but clears the tabu history, as a
+        fresh region of the search space makes the old move bans
+        meaningless. Used by TabuPool when a stagnant trajectory adopts
+        the pool's elite solution.
+        """
+        with self.lock:
+            np.copyto(self.current_candidate, candidate)
+            self.current_fitness = self._calculate_fitness(
+                self.current_candidate
+            )
+            self.current_swap = None
+            self._tabu_bitmap[:] = False
+            self._tabu_head = 0
+            self._tabu_count = 0
 
     def get_current_state(self):
         """
@@ -376,14 +1130,122 @@ class TabuCracker:
         with self.lock:
             return {
                 "candidate": self.current_candidate.copy(),
-                "best_candidate": self.best_candidate.copy(),
+                "best_candidate": self.best_candidate,  # solo cambia al mejorar
                 "fitness": self.current_fitness,
                 "best_fitness": self.best_fitness,
                 "iteration": self.iteration,
-                "tabu_size": len(self.tabu_deque),
-                "target_state": (
-                    self.target_state.copy() if self.target_state is not None else None
-                ),
+                "tabu_size": self._tabu_count,
+                "target_state": self.target_state,  # vista de solo lectura
                 "predicted_keystream": self.current_predicted_keystream.copy(),
-                "target_keystream": self.target_keystream.copy(),
+                "target_keystream": self.target_keystream,  # vista de solo lectura
             }
+
+
+class TabuPool:
+    """
+    Multi-start Tabu Search: K independent TabuCracker trajectories with
+    distinct RNG streams that share an elite solution.
+
+    Each trajectory runs in its own thread — the kernels release the GIL,
+    so they genuinely run in parallel. On improvement a trajectory
+    publishes its best into the pool; when it stagnates for
+    stagnation_limit iterations it adopts the pool's elite candidate and
+    restarts from there with a cleared tabu history.
+    """
+
+    def __init__(self, target_keystream, N=256, K=4, target_state=None,
+                 seed=None, stagnation_limit=100):
+        init_seed, *seeds = np.random.SeedSequence(seed).spawn(K + 1)
+
+        # All K starting permutations in one vectorized draw: permuted()
+        # shuffles every row of the tiled identity independently, instead
+        # of K separate per-cracker shuffle calls
+        initials = np.random.default_rng(init_seed).permuted(
+            np.tile(np.arange(N, dtype=np.uint8), (K, 1)), axis=1
+        )
+
+        self.crackers = [
+            TabuCracker(
+                target_keystream, N=N, target_state=target_state, seed=s,
+                initial_candidate=initial
+            )
+            for s, initial in zip(seeds, initials)
+        ]
+        self.keystream_length = self.crackers[0].keystream_length
+        self.stagnation_limit = stagnation_limit
+
+        elite = max(self.crackers, key=lambda c: c.best_fitness)
+        self.best_fitness = elite.best_fitness
+        self.best_candidate = elite.best_candidate  # vista de solo lectura
+
+        self.running = False
+        self._pool_lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+
+    def _publish(self, cracker):
+        """Push a trajectory's best into the pool if it leads."""
+        with self._pool_lock:
+            if cracker.best_fitness > self.best_fitness:
+                self.best_fitness = cracker.best_fitness
+                self.best_candidate = cracker.best_candidate
+
+    def _run_trajectory(self, cracker, max_iterations):
+        """Worker loop for one trajectory."""
+        stagnant = 0
+        local_best = cracker.best_fitness
+        for _ in range(max_iterations):
+            if not self.running:
+                break
+
+            cracker.step(collect_stats=False)
+
+            if cracker.best_fitness > local_best:
+                local_best = cracker.best_fitness
+                stagnant = 0
+                self._publish(cracker)
+                if local_best == self.keystream_length:
+                    # Solution found: wind down the whole pool
+                    self.running = False
+                    break
+            else:
+                stagnant += 1
+                if stagnant >= self.stagnation_limit:
+                    with self._pool_lock:
+                        elite = self.best_candidate
+                        elite_fitness = self.best_fitness
+                    if elite_fitness > cracker.current_fitness:
+                        cracker.restart_from(elite)
+                    stagnant = 0
+
+    def run(self, max_iterations=1000):
+        """
+        Launch all trajectories in background threads.
+
+        Returns:
+            list of concurrent.futures.Future, one per trajectory.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(self.crackers), thread_name_prefix="tabu-pool"
+            )
+        self.running = True
+        self._futures = [
+            self._executor.submit(self._run_trajectory, cracker, max_iterations)
+            for cracker in self.crackers
+        ]
+        return self._futures
+
+    def stop(self, timeout=1.0):
+        """Stop all trajectories and wait up to timeout seconds."""
+        self.running = False
+        if self._futures:
+            concurrent.futures.wait(self._futures, timeout=timeout)
+
+    def shutdown(self, timeout=1.0):
+        """Stop the pool and release its worker threads."""
+        self.stop(timeout=timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._futures = []